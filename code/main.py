@@ -1,16 +1,22 @@
 import pygame
+from math import hypot
 from os.path import join
-from random import randint, uniform
+from random import choice, randint
 
 # ======================
 # Init / Window
 # ======================
 pygame.init()
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
-display_surface = pygame.display.set_mode(
-    (WINDOW_WIDTH, WINDOW_HEIGHT),
-    pygame.HWSURFACE | pygame.DOUBLEBUF  # small perf boost
-)
+try:
+    # SCALED goes through SDL's renderer, so the final present is GPU-backed
+    # and can sync to the monitor (HWSURFACE is a no-op on SDL2)
+    display_surface = pygame.display.set_mode(
+        (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED, vsync=1
+    )
+except pygame.error:
+    # no vsync-capable renderer available
+    display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED)
 pygame.display.set_caption("Space Shooter")
 clock = pygame.time.Clock()
 
@@ -52,46 +58,112 @@ game_music.play(loops=-1)
 # Rotation Cache (perf)
 # ======================
 ROT_STEP_DEG = 5
-_METEOR_CACHE = {}  # idx -> (surf, mask)
-
-def get_meteor_frame(base_surf: pygame.Surface, angle_deg: float):
-    """Return cached (surface, mask) for quantized angle."""
-    steps = 360 // ROT_STEP_DEG
-    idx = int(angle_deg // ROT_STEP_DEG) % steps
-    cached = _METEOR_CACHE.get(idx)
-    if cached is None:
-        quant_angle = idx * ROT_STEP_DEG
-        rot_surf = pygame.transform.rotozoom(base_surf, quant_angle, 1)
-        rot_mask = pygame.mask.from_surface(rot_surf)
-        cached = (rot_surf, rot_mask)
-        _METEOR_CACHE[idx] = cached
-    return cached
+ROT_STEPS = 360 // ROT_STEP_DEG
+_INV_ROT_STEP = 1 / ROT_STEP_DEG
+
+def build_meteor_cache(base_surf: pygame.Surface):
+    """Pre-render a surface for every quantized angle, indexed by step.
+
+    Frames are padded to one shared size so a meteor's rect never has to
+    be rebuilt when its rotation frame changes. Each frame's unpadded rect
+    (relative to the padded topleft) is returned too, as its hitbox.
+    """
+    rotated = [
+        pygame.transform.rotozoom(base_surf, idx * ROT_STEP_DEG, 1)
+        for idx in range(ROT_STEPS)
+    ]
+    size = (max(r.get_width() for r in rotated), max(r.get_height() for r in rotated))
+    frames, rects = [], []
+    for rot_surf in rotated:
+        frame = pygame.Surface(size, pygame.SRCALPHA)
+        rect = rot_surf.get_rect(center=(size[0] / 2, size[1] / 2))
+        frame.blit(rot_surf, rect)
+        frames.append(frame.convert_alpha())  # match display pixel format
+        rects.append(rect)
+    return tuple(frames), tuple(rects)
+
+# built once up front so no rotation work happens mid-game
+_METEOR_CACHE, _METEOR_HIT_RECTS = build_meteor_cache(meteor_surf)
+_METEOR_MASKS = tuple(pygame.mask.from_surface(frame) for frame in _METEOR_CACHE)
+
+def hit_radius(mask: pygame.mask.Mask):
+    """Distance from the mask centre to its farthest set pixel.
+
+    The farthest pixel always lies on a component outline, so only those
+    are checked. +1 px covers rect.center rounding on odd-sized images.
+    """
+    cx, cy = mask.get_size()[0] / 2, mask.get_size()[1] / 2
+    far = 0.0
+    for comp in mask.connected_components():
+        for x, y in comp.outline() or [comp.centroid()]:
+            far = max(far, hypot(x + 0.5 - cx, y + 0.5 - cy))
+    return far + 1
+
+# one radius that encloses the rock in every rotation frame
+METEOR_RADIUS = max(hit_radius(mask) for mask in _METEOR_MASKS)
+
+def collide_circle_mask(a, b):
+    """Pixel-exact collision, with a cheap enclosing-circle test first."""
+    return pygame.sprite.collide_circle(a, b) and pygame.sprite.collide_mask(a, b)
 
 # ======================
 # Sprites
 # ======================
+SCREEN_RECT = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+DIAGONAL_SCALE = 0.7071067811865476  # 1 / sqrt(2)
+
+METEOR_LIFETIME_MS = 2000
+
+# pre-normalized meteor headings spanning the old (-0.5..0.5, 1) cone
+METEOR_HEADINGS = 16
+METEOR_DIRECTIONS = tuple(
+    (x / hypot(x, 1), 1 / hypot(x, 1))
+    for x in (-0.5 + i / (METEOR_HEADINGS - 1) for i in range(METEOR_HEADINGS))
+)
+
+# pick the batched blit once: fblits is pygame-ce only
+if hasattr(pygame.Surface, "fblits"):
+    def blit_batch(surface, blit_seq):
+        surface.fblits(blit_seq)
+else:  # plain pygame has no fblits
+    def blit_batch(surface, blit_seq):
+        surface.blits(blit_seq, doreturn=False)
+
+
+class BatchedGroup(pygame.sprite.Group):
+    """Group that updates and draws its sprites in one pass."""
+    def step(self, surface, *args):
+        """Update every sprite and draw the ones still alive with one batched blit."""
+        blit_seq = []
+        for s in self.sprites():
+            s.update(*args)
+            if s.alive():
+                blit_seq.append((s.image, s.rect))
+        blit_batch(surface, blit_seq)
+
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, groups):
         super().__init__(groups)
         self.image = player_surf
         self.rect = self.image.get_rect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2))
-        self.direction = pygame.Vector2()
         self.speed = 300
         self.can_shoot = True
         self.laser_shoot_time = 0
         self.cooldown_duration = 400  # ms
         self.mask = pygame.mask.from_surface(self.image)
+        self.radius = hit_radius(self.mask)
 
         # win animation helpers
         self.win_boosting = False
         self.win_boost_speed = -1400  # pixels/sec upward
 
-    def _laser_timer(self):
+    def _laser_timer(self, now_ms):
         if not self.can_shoot:
-            if pygame.time.get_ticks() - self.laser_shoot_time >= self.cooldown_duration:
+            if now_ms - self.laser_shoot_time >= self.cooldown_duration:
                 self.can_shoot = True
 
-    def update(self, dt):
+    def update(self, dt, keys, now_ms):
         # During win animation we control the ship; ignore inputs
         if game_state == STATE_WIN:
             if not self.win_boosting:
@@ -116,33 +188,24 @@ class Player(pygame.sprite.Sprite):
             return
 
         # Normal play controls
-        keys = pygame.key.get_pressed()
-        self.direction.x = int(keys[pygame.K_RIGHT]) - int(keys[pygame.K_LEFT])
-        self.direction.y = int(keys[pygame.K_DOWN]) - int(keys[pygame.K_UP])
-        if self.direction.length_squared() > 0:
-            self.direction = self.direction.normalize()
-        self.rect.centerx += self.direction.x * self.speed * dt
-        self.rect.centery += self.direction.y * self.speed * dt
-        self.rect.clamp_ip(pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
+        dx = int(keys[pygame.K_RIGHT]) - int(keys[pygame.K_LEFT])
+        dy = int(keys[pygame.K_DOWN]) - int(keys[pygame.K_UP])
+        if dx or dy:
+            step = self.speed * dt
+            if dx and dy:
+                step *= DIAGONAL_SCALE  # keep diagonal speed normalized
+            self.rect.centerx += dx * step
+            self.rect.centery += dy * step
+            self.rect.clamp_ip(SCREEN_RECT)
 
         # shooting (edge-trigger simulated with get_pressed is okay here)
-        just = pygame.key.get_pressed()
-        if just[pygame.K_SPACE] and self.can_shoot:
+        if keys[pygame.K_SPACE] and self.can_shoot:
             Laser(laser_surf, self.rect.midtop, (all_sprites, laser_sprites))
             self.can_shoot = False
-            self.laser_shoot_time = pygame.time.get_ticks()
+            self.laser_shoot_time = now_ms
             laser_sound.play()
 
-        self._laser_timer()
-
-
-class Star(pygame.sprite.Sprite):
-    def __init__(self, group, surf):
-        super().__init__(group)
-        self.image = surf
-        self.rect = self.image.get_rect(
-            center=(randint(0, WINDOW_WIDTH), randint(0, WINDOW_HEIGHT))
-        )
+        self._laser_timer(now_ms)
 
 
 class Laser(pygame.sprite.Sprite):
@@ -152,78 +215,117 @@ class Laser(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(midbottom=pos)
         self.speed = 500
 
-    def update(self, dt):
+    def update(self, dt, keys, now_ms):
         self.rect.centery -= self.speed * dt
         if self.rect.bottom < 0:
             self.kill()
 
 
 class Meteor(pygame.sprite.Sprite):
-    def __init__(self, surf, pos, groups):
+    def __init__(self, pos, groups):
         super().__init__(groups)
-        self.base_surface = surf
 
         # start with a cached frame
-        self.image, self.mask = get_meteor_frame(self.base_surface, 0)
+        self.frame_idx = 0
+        self.image = _METEOR_CACHE[0]
+        self.mask = _METEOR_MASKS[0]
         self.rect = self.image.get_rect(center=pos)
+        self._cx, self._cy = self.rect.center  # float position
+        self.radius = METEOR_RADIUS
 
         # motion
-        self.start_time = pygame.time.get_ticks()
-        self.lifetime = 2000  # ms
-        self.direction = pygame.Vector2(uniform(-0.5, 0.5), 1)
-        if self.direction.length_squared() == 0:
-            self.direction.y = 1
-        self.direction = self.direction.normalize()
+        self.expire_time = pygame.time.get_ticks() + METEOR_LIFETIME_MS
+        dir_x, dir_y = choice(METEOR_DIRECTIONS)
         self.speed = randint(400, 500)
+        # per-frame velocity, so update is two multiply-adds
+        self.vel_x = dir_x * self.speed
+        self.vel_y = dir_y * self.speed
 
-        # rotation
-        self.rotation = 0.0
+        # rotation, tracked in cache steps rather than degrees
         self.rotation_speed = randint(40, 80)  # deg/s
+        self.rot_idx = 0.0
+        self.rot_idx_speed = self.rotation_speed * _INV_ROT_STEP  # steps/s
 
-    def update(self, dt):
+    def update(self, dt, keys, now_ms):
         # stop meteors moving during win screen (so scene freezes while ship exits)
         if game_state == STATE_WIN:
             return
 
         # movement
-        self.rect.centerx += self.direction.x * self.speed * dt
-        self.rect.centery += self.direction.y * self.speed * dt
+        self._cx += self.vel_x * dt
+        self._cy += self.vel_y * dt
+        self.rect.center = (self._cx, self._cy)
 
         # lifetime
-        if pygame.time.get_ticks() - self.start_time > self.lifetime:
+        if now_ms > self.expire_time:
             self.kill()
             return
 
         # rotation via cache
-        self.rotation = (self.rotation + self.rotation_speed * dt) % 360
-        new_img, new_mask = get_meteor_frame(self.base_surface, self.rotation)
-        center = self.rect.center
-        self.image = new_img
-        self.mask = new_mask
-        self.rect = self.image.get_rect(center=center)
+        self.rot_idx = (self.rot_idx + self.rot_idx_speed * dt) % ROT_STEPS
+        idx = self.frame_idx = int(self.rot_idx)
+        self.image = _METEOR_CACHE[idx]  # same size, rect stays valid
+        self.mask = _METEOR_MASKS[idx]
+
+    def hit_rect(self):
+        """Rect of the current unpadded frame; rect itself covers every rotation."""
+        return _METEOR_HIT_RECTS[self.frame_idx].move(self.rect.topleft)
+
 
+# finished explosions wait here to be reused instead of reallocated
+_explosion_pool = []
 
 class AnimatedExplosion(pygame.sprite.Sprite):
     def __init__(self, frames, pos, groups):
         super().__init__(groups)
         self.frames = frames
-        self.frame_index = 0.0
+        self.frame_count = len(frames)
         self.speed = 20  # fps (scaled by dt)
+        self.reset(pos)
+
+    def reset(self, pos):
+        self.frame_index = 0.0
         self.image = self.frames[0]
         self.rect = self.image.get_rect(center=pos)
 
-    def update(self, dt):
+    def update(self, dt, keys, now_ms):
         self.frame_index += self.speed * dt
-        if self.frame_index < len(self.frames):
+        if self.frame_index < self.frame_count:
             center = self.rect.center
             self.image = self.frames[int(self.frame_index)]
             self.rect = self.image.get_rect(center=center)
         else:
             self.kill()
 
+    def kill(self):
+        if self.alive():  # only pool once, even if killed twice
+            super().kill()
+            _explosion_pool.append(self)
+
+
+def spawn_explosion(pos, groups):
+    """Start an explosion at pos, reusing a pooled sprite when one is free."""
+    if _explosion_pool:
+        explosion = _explosion_pool.pop()
+        explosion.reset(pos)
+        explosion.add(groups)
+    else:
+        AnimatedExplosion(explosion_frames, pos, groups)
+
 # ======================
 # Game Functions & State
 # ======================
+BG_COLOR = "#3a2e3f"
+
+def build_starfield():
+    """Return the background with 20 randomly placed stars baked in."""
+    surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    surf.fill(BG_COLOR)
+    for _ in range(20):
+        pos = (randint(0, WINDOW_WIDTH), randint(0, WINDOW_HEIGHT))
+        surf.blit(star_surf, star_surf.get_rect(center=pos))
+    return surf
+
 def set_game_over():
     """Switch to GAME_OVER state."""
     global game_state
@@ -237,7 +339,7 @@ def set_win():
 
 def reset_game():
     """Reset all entities and timers and return to PLAYING state."""
-    global all_sprites, meteor_sprites, laser_sprites, player, game_state, game_start_ms
+    global all_sprites, meteor_sprites, laser_sprites, player, game_state, game_start_ms, starfield
 
     # clear groups
     all_sprites.empty()
@@ -245,8 +347,7 @@ def reset_game():
     laser_sprites.empty()
 
     # rebuild stars
-    for _ in range(20):
-        Star(all_sprites, star_surf)
+    starfield = build_starfield()
 
     # new player
     player = Player(all_sprites)
@@ -262,68 +363,94 @@ def collisions():
     if game_state != STATE_PLAYING:
         return
 
-    # player vs meteors (mask collide)
-    if pygame.sprite.spritecollide(player, meteor_sprites, True, pygame.sprite.collide_mask):
+    # player vs meteors (circle pre-check, then exact mask collide)
+    if pygame.sprite.spritecollide(player, meteor_sprites, True, collide_circle_mask):
         set_game_over()
 
-    # lasers vs meteors (rect is fine & faster)
+    # lasers vs meteors (rect is fine & faster); the rect list is built once
+    # so each laser is a single C-side collidelistall scan
+    if not laser_sprites:
+        return
+    meteors = meteor_sprites.sprites()
+    meteor_rects = [m.hit_rect() for m in meteors]
     for laser in laser_sprites.sprites():
-        hit = pygame.sprite.spritecollide(laser, meteor_sprites, True)
+        hit = [meteors[i] for i in laser.rect.collidelistall(meteor_rects) if meteors[i].alive()]
         if hit:
+            for meteor in hit:
+                meteor.kill()
             laser.kill()
-            AnimatedExplosion(explosion_frames, laser.rect.midtop, all_sprites)
+            spawn_explosion(laser.rect.midtop, all_sprites)
             explosion_sound.play()
 
 def get_score_value():
     """Return the integer score (time survived scaled the same way as before)."""
     return (pygame.time.get_ticks() - game_start_ms) // 100
 
+# (label, color) -> (value, surface); TTF rendering is only redone when the
+# value changes (score ticks ~10x/s, frames run at up to 120 FPS)
+_score_text_cache = {}
+
+def render_score_text(label, value, color):
+    """Return a cached `label: value` surface, re-rendered on value change."""
+    key = (label, color)
+    cached = _score_text_cache.get(key)
+    if cached is None or cached[0] != value:
+        cached = (value, small_font.render(f"{label}: {value}", True, color).convert_alpha())
+        _score_text_cache[key] = cached
+    return cached[1]
+
 def draw_score_top_left():
     score_val = get_score_value()
-    text = small_font.render(f"Score: {score_val}", True, (240, 240, 240))
+    text = render_score_text("Score", score_val, (240, 240, 240))
     rect = text.get_rect(topleft=(16, 14))
     # subtle box
     pygame.draw.rect(display_surface, (240, 240, 240), rect.inflate(16, 10), width=2, border_radius=8)
     display_surface.blit(text, rect)
     return score_val
 
+# end-screen overlays and fixed text never change, so build them once
+# (convert_alpha() puts them in the display's pixel format for fast blits)
+_death_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+_death_overlay.fill((0, 0, 0, 170))
+_death_overlay = _death_overlay.convert_alpha()
+_death_title = font.render("YOU DIED", True, (255, 90, 90)).convert_alpha()
+_death_retry = small_font.render("Press R to Retry   •   ESC to Quit", True, (220, 220, 220)).convert_alpha()
+
+_win_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+_win_overlay.fill((0, 20, 40, 120))
+_win_overlay = _win_overlay.convert_alpha()
+_win_title = font.render("YOU WIN!", True, (120, 255, 160)).convert_alpha()
+_win_retry = small_font.render("Press R to Play Again   •   ESC to Quit", True, (220, 230, 220)).convert_alpha()
+
 def draw_death_screen(final_score):
     # dark overlay
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 170))
-    display_surface.blit(overlay, (0, 0))
+    display_surface.blit(_death_overlay, (0, 0))
 
-    title = font.render("YOU DIED", True, (255, 90, 90))
-    score_txt = small_font.render(f"Score: {final_score}", True, (230, 230, 230))
-    retry_txt = small_font.render("Press R to Retry   •   ESC to Quit", True, (220, 220, 220))
+    score_txt = render_score_text("Score", final_score, (230, 230, 230))
 
-    display_surface.blit(title, title.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 40)))
+    display_surface.blit(_death_title, _death_title.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 40)))
     display_surface.blit(score_txt, score_txt.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 10)))
-    display_surface.blit(retry_txt, retry_txt.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 60)))
+    display_surface.blit(_death_retry, _death_retry.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 60)))
 
 def draw_win_screen(final_score):
     # subtle overlay while ship exits
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 20, 40, 120))
-    display_surface.blit(overlay, (0, 0))
+    display_surface.blit(_win_overlay, (0, 0))
 
-    title = font.render("YOU WIN!", True, (120, 255, 160))
-    score_txt = small_font.render(f"Final Score: {final_score}", True, (230, 255, 230))
-    retry_txt = small_font.render("Press R to Play Again   •   ESC to Quit", True, (220, 230, 220))
+    score_txt = render_score_text("Final Score", final_score, (230, 255, 230))
 
-    display_surface.blit(title, title.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 40)))
+    display_surface.blit(_win_title, _win_title.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 40)))
     display_surface.blit(score_txt, score_txt.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 10)))
-    display_surface.blit(retry_txt, retry_txt.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 60)))
+    display_surface.blit(_win_retry, _win_retry.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 60)))
 
 # ======================
 # Groups & Entities
 # ======================
-all_sprites = pygame.sprite.Group()
+all_sprites = BatchedGroup()  # drawn every frame -> batched blits
 meteor_sprites = pygame.sprite.Group()
 laser_sprites = pygame.sprite.Group()
 
-for _ in range(20):
-    Star(all_sprites, star_surf)
+# stars never move: pre-composite them into the background once
+starfield = build_starfield()
 
 player = Player(all_sprites)
 
@@ -352,7 +479,7 @@ while running:
         # spawn meteors only during PLAYING
         if game_state == STATE_PLAYING and event.type == meteor_event and len(meteor_sprites) < MAX_METEORS:
             x, y = randint(0, WINDOW_WIDTH), randint(-200, -100)
-            Meteor(meteor_surf, (x, y), (all_sprites, meteor_sprites))
+            Meteor((x, y), (all_sprites, meteor_sprites))
 
         # end-screen inputs
         if (game_state in (STATE_GAME_OVER, STATE_WIN)) and event.type == pygame.KEYDOWN:
@@ -361,8 +488,7 @@ while running:
             if event.key == pygame.K_ESCAPE:
                 running = False
 
-    # update & collisions
-    all_sprites.update(dt)
+    # collisions run on the positions drawn last frame
     collisions()
 
     # win check (only from active play)
@@ -373,9 +499,11 @@ while running:
             # stop meteors from spawning further
             set_win()
 
-    # draw
-    display_surface.fill("#3a2e3f")
-    all_sprites.draw(display_surface)
+    # update & draw in a single pass (keys/ticks read once per frame and shared)
+    keys = pygame.key.get_pressed()
+    now_ms = pygame.time.get_ticks()
+    display_surface.blit(starfield, (0, 0))
+    all_sprites.step(display_surface, dt, keys, now_ms)
 
     # score always shown top-left during play; frozen on end screens
     if game_state == STATE_PLAYING:
@@ -388,6 +516,8 @@ while running:
         draw_score_top_left()
         draw_win_screen(final_score_cache)
 
-    pygame.display.update()
+    # whole screen is repainted every frame, so a full flip beats
+    # tracking dirty rects for a moving meteor field
+    pygame.display.flip()
 
 pygame.quit()